@@ -3,41 +3,44 @@ Tests for the Mergington High School API
 """
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            **details,
-            "participants": details["participants"].copy()
-        }
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create a single async test client for the FastAPI app, shared by all tests"""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test", follow_redirects=False
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def original_participants():
+    """Snapshot the original participants of each activity once per test session"""
+    return {
+        name: details["participants"].copy()
         for name, details in activities.items()
     }
-    
+
+
+@pytest.fixture
+def reset_activities(original_participants):
+    """Restore participants to their original state after each test"""
     yield
-    
-    # Restore original state after test
-    for name, details in original_activities.items():
-        activities[name]["participants"] = details["participants"].copy()
+
+    for name, participants in original_participants.items():
+        activities[name]["participants"] = participants.copy()
 
 
 class TestRoot:
     """Tests for the root endpoint"""
     
-    def test_root_redirects_to_index(self, client):
+    async def test_root_redirects_to_index(self, client):
         """Test that root path redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/")
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -45,27 +48,15 @@ class TestRoot:
 class TestGetActivities:
     """Tests for getting all activities"""
     
-    def test_get_activities_success(self, client):
-        """Test successfully retrieving all activities"""
-        response = client.get("/activities")
+    async def test_get_activities_success(self, client):
+        """Test retrieving all activities and that each has the required keys"""
+        response = await client.get("/activities")
         assert response.status_code == 200
         
         data = response.json()
         assert isinstance(data, dict)
         assert len(data) > 0
         
-        # Check structure of first activity
-        first_activity = list(data.values())[0]
-        assert "description" in first_activity
-        assert "schedule" in first_activity
-        assert "max_participants" in first_activity
-        assert "participants" in first_activity
-    
-    def test_activities_have_expected_keys(self, client):
-        """Test that all activities have the required keys"""
-        response = client.get("/activities")
-        data = response.json()
-        
         for activity_name, activity_data in data.items():
             assert "description" in activity_data
             assert "schedule" in activity_data
@@ -75,16 +66,17 @@ class TestGetActivities:
             assert isinstance(activity_data["max_participants"], int)
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignup:
     """Tests for signing up for activities"""
     
-    def test_signup_success(self, client):
+    async def test_signup_success(self, client):
         """Test successfully signing up for an activity"""
         # Find an activity with available spots
         activity_name = "Drama Club"
         email = "newstudent@mergington.edu"
         
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         
@@ -95,61 +87,48 @@ class TestSignup:
         assert activity_name in data["message"]
         
         # Verify the student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity_name]["participants"]
+        assert email in activities[activity_name]["participants"]
     
-    def test_signup_duplicate_fails(self, client):
+    async def test_signup_duplicate_fails(self, client):
         """Test that signing up twice for the same activity fails"""
         activity_name = "Soccer Team"
         email = "alex@mergington.edu"  # Already registered
         
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"].lower()
+        assert b"already signed up" in response.content.lower()
     
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for a non-existent activity fails"""
-        response = client.post(
-            "/activities/NonExistent%20Activity/signup?email=test@mergington.edu"
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_signup_full_activity_fails(self, client):
+    async def test_signup_full_activity_fails(self, client):
         """Test that signing up for a full activity fails"""
         activity_name = "Chess Club"
         
         # Fill up the activity
-        for i in range(activities[activity_name]["max_participants"] - len(activities[activity_name]["participants"])):
-            email = f"student{i}@mergington.edu"
-            client.post(f"/activities/{activity_name}/signup?email={email}")
+        participants = activities[activity_name]["participants"]
+        remaining = activities[activity_name]["max_participants"] - len(participants)
+        participants.extend(f"student{i}@mergington.edu" for i in range(remaining))
         
         # Try to add one more
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup?email=overflow@mergington.edu"
         )
         
         assert response.status_code == 400
-        data = response.json()
-        assert "full" in data["detail"].lower()
+        assert b"activity is full" in response.content.lower()
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregister:
     """Tests for unregistering from activities"""
     
-    def test_unregister_success(self, client):
+    async def test_unregister_success(self, client):
         """Test successfully unregistering from an activity"""
         activity_name = "Soccer Team"
         email = "alex@mergington.edu"  # Already registered
         
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
         
@@ -160,84 +139,73 @@ class TestUnregister:
         assert activity_name in data["message"]
         
         # Verify the student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity_name]["participants"]
+        assert email not in activities[activity_name]["participants"]
     
-    def test_unregister_not_registered_fails(self, client):
+    async def test_unregister_not_registered_fails(self, client):
         """Test that unregistering when not registered fails"""
         activity_name = "Soccer Team"
         email = "notregistered@mergington.edu"
         
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
         
         assert response.status_code == 400
-        data = response.json()
-        assert "not registered" in data["detail"].lower()
+        assert b"not registered" in response.content.lower()
+
+
+class TestNonexistentActivity:
+    """Tests for requests against activities that do not exist"""
     
-    def test_unregister_nonexistent_activity_fails(self, client):
-        """Test that unregistering from a non-existent activity fails"""
-        response = client.delete(
-            "/activities/NonExistent%20Activity/unregister?email=test@mergington.edu"
+    @pytest.mark.parametrize("method,path", [("post", "signup"), ("delete", "unregister")])
+    async def test_nonexistent_activity_fails(self, client, method, path):
+        """Test that signing up for or unregistering from a non-existent activity fails"""
+        response = await getattr(client, method)(
+            f"/activities/NonExistent%20Activity/{path}?email=test@mergington.edu"
         )
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert b"activity not found" in response.content.lower()
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestEndToEndFlow:
     """Integration tests for complete user flows"""
     
-    def test_signup_and_unregister_flow(self, client):
+    async def test_signup_and_unregister_flow(self, client):
         """Test complete flow of signing up and then unregistering"""
         activity_name = "Art Workshop"
         email = "flowtest@mergington.edu"
         
-        # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity_name]["participants"])
+        initial_count = len(activities[activity_name]["participants"])
         
         # Sign up
-        signup_response = client.post(
+        signup_response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         assert signup_response.status_code == 200
-        
-        # Verify participant was added
-        after_signup = client.get("/activities")
-        after_signup_count = len(after_signup.json()[activity_name]["participants"])
-        assert after_signup_count == initial_count + 1
-        assert email in after_signup.json()[activity_name]["participants"]
+        assert email in activities[activity_name]["participants"]
+        assert len(activities[activity_name]["participants"]) == initial_count + 1
         
         # Unregister
-        unregister_response = client.delete(
+        unregister_response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
-        
-        # Verify participant was removed
-        after_unregister = client.get("/activities")
-        after_unregister_count = len(after_unregister.json()[activity_name]["participants"])
-        assert after_unregister_count == initial_count
-        assert email not in after_unregister.json()[activity_name]["participants"]
+        assert email not in activities[activity_name]["participants"]
+        assert len(activities[activity_name]["participants"]) == initial_count
     
-    def test_multiple_signups_different_activities(self, client):
+    async def test_multiple_signups_different_activities(self, client):
         """Test that a student can sign up for multiple activities"""
         email = "multisport@mergington.edu"
         activities_to_join = ["Soccer Team", "Track and Field"]
         
         for activity_name in activities_to_join:
-            response = client.post(
+            response = await client.post(
                 f"/activities/{activity_name}/signup?email={email}"
             )
             assert response.status_code == 200
         
         # Verify student is in both activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
         for activity_name in activities_to_join:
-            assert email in activities_data[activity_name]["participants"]
+            assert email in activities[activity_name]["participants"]